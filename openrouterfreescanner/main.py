@@ -1,27 +1,83 @@
 import requests
 import json
 import argparse
-
-def get_free_models(exclude_routers=True):
+import os
+import sys
+import time
+from operator import itemgetter
+import orjson
+
+# Pricing values OpenRouter actually emits for free models; anything else
+# falls back to a float comparison
+_FREE_PRICES = frozenset({"0", "0.0", 0, None})
+
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "openrouter-free-scanner")
+CACHE_FILE = os.path.join(CACHE_DIR, "models.json")
+DEFAULT_CACHE_TTL = 3600
+
+def _is_free_price(value):
+    """Returns True if a pricing value represents zero cost."""
+    try:
+        # Membership test first: an unhashable value raises TypeError too
+        if value in _FREE_PRICES:
+            return True
+        return float(value) == 0
+    except (TypeError, ValueError):
+        return False
+
+def _read_models_cache(cache_ttl):
+    """Returns the cached raw models list if it is younger than cache_ttl, else None."""
+    try:
+        with open(CACHE_FILE) as f:
+            cached = json.load(f)
+        if time.time() - cached.get("fetched_at", 0) < cache_ttl:
+            return cached.get("data", [])
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _write_models_cache(models):
+    """Atomically writes the raw models list to the cache file."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = CACHE_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"fetched_at": time.time(), "data": models}, f)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError:
+        pass  # Cache is best-effort; a failed write just means a refetch later
+
+def get_free_models(exclude_routers=True, session=None, cache_ttl=DEFAULT_CACHE_TTL):
     """
     Fetches the list of all models from the OpenRouter API and returns the free ones.
-    
+
+    The raw model list changes rarely, so it is cached on disk and reused
+    until it is older than cache_ttl, avoiding a network round-trip.
+
     Args:
         exclude_routers (bool): If True, excludes router models.
+        session (requests.Session, optional): Session to use for the request,
+            allowing connection reuse. Defaults to a one-off request.
+        cache_ttl (int): Seconds to reuse the cached model list. 0 disables
+            the cache and always fetches.
     """
     try:
-        response = requests.get("https://openrouter.ai/api/v1/models")
-        response.raise_for_status()  # Raise an exception for bad status codes
-        models = response.json().get("data", [])
+        models = _read_models_cache(cache_ttl) if cache_ttl else None
+        if models is None:
+            response = (session or requests).get("https://openrouter.ai/api/v1/models")
+            response.raise_for_status()  # Raise an exception for bad status codes
+            models = response.json().get("data", [])
+            _write_models_cache(models)
+
         if exclude_routers:
             models = [model for model in models if "router" not in model.get("id", "").lower()]
-        
+
         free_models = []
         for model in models:
             pricing = model.get("pricing", {})
-            if float(pricing.get("prompt", "0")) == 0 and float(pricing.get("completion", "0")) == 0:
+            if _is_free_price(pricing.get("prompt")) and _is_free_price(pricing.get("completion")):
                 free_models.append(model)
-                
+
         return free_models
 
     except requests.exceptions.RequestException as e:
@@ -42,25 +98,20 @@ def filter_models(models, name=None, min_context_length=None, provider=None, req
     Returns:
         list: The filtered list of models.
     """
-    filtered_models = models
-
-    if name:
-        filtered_models = [model for model in filtered_models if name.lower() in model.get("name", "").lower()]
-    
-    if min_context_length:
-        filtered_models = [model for model in filtered_models if model.get("context_length", 0) >= min_context_length]
-
-    if provider:
-        filtered_models = [model for model in filtered_models if provider.lower() in model.get("id", "").lower().split("/")[0]]
-    
-    if required_parameters:
-        filtered_models = [
-            model for model in filtered_models 
-            if all(param in model.get('supported_parameters', []) 
-                  for param in required_parameters)
-        ]
-
-    return filtered_models
+    # Lowercase the needles once and apply every predicate in a single pass
+    # instead of building an intermediate list per criterion
+    name_lc = name.lower() if name else None
+    provider_lc = provider.lower() if provider else None
+
+    return [
+        model for model in models
+        if (name_lc is None or name_lc in model.get("name", "").lower())
+        and (min_context_length is None or model.get("context_length", 0) >= min_context_length)
+        and (provider_lc is None or provider_lc in model.get("id", "").lower().split("/", 1)[0])
+        and (not required_parameters
+             or all(param in model.get("supported_parameters", [])
+                    for param in required_parameters))
+    ]
 
 def sort_models(models, sort_by='name', reverse=False):
     """
@@ -74,7 +125,11 @@ def sort_models(models, sort_by='name', reverse=False):
     Returns:
         list: The sorted list of models.
     """
-    return sorted(models, key=lambda x: x.get(sort_by, 0), reverse=reverse)
+    # Decorate-sort-undecorate: .get() runs once per model and the sort key
+    # is the C-level itemgetter instead of a Python lambda per comparison
+    keyed = [(model.get(sort_by, 0), model) for model in models]
+    keyed.sort(key=itemgetter(0), reverse=reverse)
+    return [model for _, model in keyed]
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch and save free models from OpenRouter.")
@@ -86,9 +141,11 @@ def main():
     parser.add_argument("--require-params", type=str, help="Comma-separated list of required parameters (e.g., 'tool_choice,tools')")
     parser.add_argument("--sort-by", type=str, default="name", help="Sort models by a specific field (e.g., name, context_length).")
     parser.add_argument("--reverse", action="store_true", help="Reverse the sort order.")
+    parser.add_argument("--cache-ttl", type=int, default=DEFAULT_CACHE_TTL,
+                        help=f"Seconds to reuse the cached model list, 0 to always fetch (default: {DEFAULT_CACHE_TTL}).")
     args = parser.parse_args()
 
-    models = get_free_models()
+    models = get_free_models(cache_ttl=args.cache_ttl)
 
     if models:
         # Parse required parameters
@@ -109,12 +166,14 @@ def main():
         if args.limit:
             models = models[:args.limit]
 
+        # orjson serializes straight to bytes, avoiding the full indented
+        # string json.dump(indent=2) would materialize in memory
         if args.output:
-            with open("free_models.json", "w") as f:
-                json.dump(models, f, indent=2)
+            with open("free_models.json", "wb") as f:
+                f.write(orjson.dumps(models, option=orjson.OPT_INDENT_2))
             print(f"Successfully saved {len(models)} models to free_models.json")
         else:
-            print(json.dumps(models, indent=2))
+            sys.stdout.buffer.write(orjson.dumps(models, option=orjson.OPT_INDENT_2) + b"\n")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,55 @@
 import argparse
-import json
+import heapq
+import os
+import socket
+import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse
+import orjson
 import requests
-from .main import get_free_models, filter_models, sort_models
+from requests.adapters import HTTPAdapter
+from .main import get_free_models, filter_models, sort_models, DEFAULT_CACHE_TTL
+
+
+# Shared session so upstream TCP/TLS connections are reused across requests
+# instead of re-handshaking with openrouter.ai on every call.
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0))
+
+# Coalescing state for fetch_models_coalesced: while a fetch is in flight,
+# concurrent callers wait on the same future instead of fetching in parallel
+_fetch_lock = threading.Lock()
+_fetch_future = None
+
+
+def fetch_models_coalesced(cache_ttl=0):
+    """Fetch the free-models list, sharing one upstream fetch among concurrent callers."""
+    global _fetch_future
+
+    with _fetch_lock:
+        future = _fetch_future
+        if future is not None:
+            # Someone else is already fetching; wait for their result
+            is_owner = False
+        else:
+            future = _fetch_future = Future()
+            is_owner = True
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        models = get_free_models(session=SESSION, cache_ttl=cache_ttl)
+        future.set_result(models)
+        return models
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _fetch_lock:
+            _fetch_future = None
 
 
 class ModelStats:
@@ -13,73 +58,181 @@ class ModelStats:
     def __init__(self, error_threshold=3):
         self.stats = {}  # model_id -> {'errors': count, 'successes': count, 'last_error': timestamp}
         self.error_threshold = error_threshold
-    
+        # Heap of (-success_rate, model_id), updated incrementally on each
+        # record so selection doesn't rescore every model per request.
+        # Entries whose rate no longer matches are stale and discarded lazily.
+        self._heap = []
+        # Handlers run on separate threads, so all access to stats is serialized
+        self._lock = threading.Lock()
+
+    def _success_rate(self, model_id):
+        """Success rate for a model (1.0 if untried); caller must hold the lock."""
+        stats = self.stats.get(model_id)
+        if not stats:
+            return 1.0  # New models get priority
+
+        total = stats['successes'] + stats['errors']
+        if total == 0:
+            return 1.0
+
+        return stats['successes'] / total
+
+    def _push(self, model_id):
+        """Queue a model at its current rate; caller must hold the lock."""
+        heapq.heappush(self._heap, (-self._success_rate(model_id), model_id))
+
     def record_error(self, model_id):
         """Record an error for a model."""
-        if model_id not in self.stats:
-            self.stats[model_id] = {'errors': 0, 'successes': 0, 'last_error': None}
-        
-        self.stats[model_id]['errors'] += 1
-        self.stats[model_id]['last_error'] = time.time()
-    
+        with self._lock:
+            if model_id not in self.stats:
+                self.stats[model_id] = {'errors': 0, 'successes': 0, 'last_error': None}
+
+            self.stats[model_id]['errors'] += 1
+            self.stats[model_id]['last_error'] = time.time()
+            self._push(model_id)
+
     def record_success(self, model_id):
         """Record a successful request for a model."""
-        if model_id not in self.stats:
-            self.stats[model_id] = {'errors': 0, 'successes': 0, 'last_error': None}
-        
-        self.stats[model_id]['successes'] += 1
-    
-    def is_model_available(self, model_id):
-        """Check if a model is available based on error threshold."""
+        with self._lock:
+            if model_id not in self.stats:
+                self.stats[model_id] = {'errors': 0, 'successes': 0, 'last_error': None}
+
+            self.stats[model_id]['successes'] += 1
+            self._push(model_id)
+
+    def _is_available(self, model_id, now):
+        """Availability check against a caller-supplied timestamp; caller must hold the lock."""
         if model_id not in self.stats:
             return True
-        
+
         stats = self.stats[model_id]
-        
-        # If last error was more than 5 minutes ago, reset error count
-        if stats['last_error'] and (time.time() - stats['last_error']) > 300:
-            stats['errors'] = 0
+
+        # If last error was more than 5 minutes ago, reset error count.
+        # last_error is cleared too so the expiry fires once per failure
+        # instead of requeueing a duplicate heap entry on every check
+        if stats['last_error'] and (now - stats['last_error']) > 300:
+            if stats['errors']:
+                stats['errors'] = 0
+                self._push(model_id)  # rate changed, requeue at the new priority
+            stats['last_error'] = None
             return True
-        
+
         return stats['errors'] < self.error_threshold
-    
-    def get_best_model(self, models):
-        """Get the best model based on success rate and availability."""
-        available_models = [m for m in models if self.is_model_available(m['id'])]
-        
-        if not available_models:
+
+    def is_model_available(self, model_id):
+        """Check if a model is available based on error threshold."""
+        with self._lock:
+            return self._is_available(model_id, time.time())
+
+    def get_best_model(self, models, exclude=None):
+        """
+        Get the best model based on success rate and availability.
+
+        Args:
+            models (list): Candidate models.
+            exclude (set, optional): Model ids to skip, e.g. ones already
+                tried while retrying a request.
+        """
+        with self._lock:
+            if exclude:
+                models = [m for m in models if m['id'] not in exclude]
+
+            if not models:
+                return None
+
+            by_id = {m['id']: m for m in models}
+            # One clock read for the whole selection pass instead of one per
+            # availability check
+            now = time.time()
+
+            # Expire stale error counts for every tracked model up front, not
+            # just the one at the heap top, so a model that failed and then
+            # recovered regains its rank instead of staying buried behind
+            # better-rated entries indefinitely
+            for model_id, stats in self.stats.items():
+                if stats['last_error'] and (now - stats['last_error']) > 300:
+                    if stats['errors']:
+                        stats['errors'] = 0
+                        self._push(model_id)  # rate changed, requeue at the new priority
+                    stats['last_error'] = None
+
+            # Untried models score a perfect 1.0 and are not in the heap;
+            # the first one is the candidate any tracked model has to beat
+            untried = next((m for m in models if m['id'] not in self.stats), None)
+
+            best = None
+            best_rate = 0.0
+            skipped = []
+            while self._heap:
+                neg_rate, model_id = self._heap[0]
+                if model_id not in self.stats or -neg_rate != self._success_rate(model_id):
+                    heapq.heappop(self._heap)  # stale entry, discard lazily
+                elif model_id not in by_id or not self._is_available(model_id, now):
+                    # Not a candidate right now, but keep it for later calls
+                    skipped.append(heapq.heappop(self._heap))
+                else:
+                    best = by_id[model_id]
+                    best_rate = -neg_rate
+                    break
+
+            for entry in skipped:
+                heapq.heappush(self._heap, entry)
+
+            if untried is not None and (best is None or best_rate < 1.0):
+                return untried
+
+            if best is not None:
+                return best
+
             # Reset all stats if no models are available
             self.stats = {}
-            return models[0] if models else None
-        
-        # Sort by success rate (successes / (successes + errors))
-        def success_rate(model):
-            model_id = model['id']
-            if model_id not in self.stats:
-                return 1.0  # New models get priority
-            
-            stats = self.stats[model_id]
-            total = stats['successes'] + stats['errors']
-            if total == 0:
-                return 1.0
-            
-            return stats['successes'] / total
-        
-        return max(available_models, key=success_rate)
+            self._heap = []
+            return models[0]
 
 
 class ProxyHandler(BaseHTTPRequestHandler):
     """HTTP request handler for OpenAI-compatible proxy."""
-    
+
+    # HTTP/1.1 so SDK clients can keep their pooled connection open between
+    # calls instead of re-handshaking every request
+    protocol_version = 'HTTP/1.1'
+
+    # Enforce the Keep-Alive timeout advertised by send_keep_alive_headers:
+    # handle_one_request drops connections idle for longer, so parked clients
+    # can't hold worker threads forever
+    timeout = 60
+
+    # Largest request body we are willing to read into memory
+    MAX_BODY = 2 * 1024 * 1024
+
+    # Hop-by-hop headers that must never be forwarded from upstream.
+    # content-encoding and content-length are included because requests
+    # already decompresses the body, invalidating both.
+    _HOP_BY_HOP = frozenset({
+        'transfer-encoding', 'connection', 'keep-alive', 'proxy-authenticate',
+        'proxy-authorization', 'te', 'trailers', 'upgrade',
+        'content-encoding', 'content-length',
+    })
+
     # Class variables shared across all instances
     models_list = []
+    models_response_body = b''
     model_stats = None
     api_key = None
-    
+
     def log_message(self, format, *args):
         """Override to add timestamp to logs."""
         print(f"[{self.log_date_time_string()}] {format % args}")
-    
+
+    def send_keep_alive_headers(self):
+        """Negotiate connection reuse based on the client's Connection header."""
+        if self.headers.get('Connection', '').lower() == 'close':
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        else:
+            self.send_header('Connection', 'keep-alive')
+            self.send_header('Keep-Alive', 'timeout=60')
+
     def do_GET(self):
         """Handle GET requests."""
         parsed_path = urlparse(self.path)
@@ -87,10 +240,13 @@ class ProxyHandler(BaseHTTPRequestHandler):
         if parsed_path.path == '/v1/models':
             self.handle_list_models()
         elif parsed_path.path == '/health':
+            body = orjson.dumps({'status': 'ok'})
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_keep_alive_headers()
             self.end_headers()
-            self.wfile.write(json.dumps({'status': 'ok'}).encode())
+            self.wfile.write(body)
         else:
             self.send_error(404, "Endpoint not found")
     
@@ -106,26 +262,15 @@ class ProxyHandler(BaseHTTPRequestHandler):
     def handle_list_models(self):
         """Handle /v1/models endpoint - OpenAI compatible."""
         try:
-            models_data = {
-                'object': 'list',
-                'data': [
-                    {
-                        'id': model['id'],
-                        'object': 'model',
-                        'created': int(time.time()),
-                        'owned_by': 'openrouter',
-                        'permission': [],
-                        'root': model['id'],
-                        'parent': None,
-                    }
-                    for model in self.models_list
-                ]
-            }
-            
+            # The payload only changes when the models list does, so it is
+            # serialized once up front (see build_models_response)
+            body = self.models_response_body
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_keep_alive_headers()
             self.end_headers()
-            self.wfile.write(json.dumps(models_data, indent=2).encode())
+            self.wfile.write(body)
         
         except Exception as e:
             self.send_error(500, f"Internal error: {str(e)}")
@@ -133,10 +278,25 @@ class ProxyHandler(BaseHTTPRequestHandler):
     def handle_chat_completion(self):
         """Handle /v1/chat/completions endpoint - OpenAI compatible with failover."""
         try:
-            # Read request body
-            content_length = int(self.headers.get('Content-Length', 0))
+            # Read request body, rejecting oversized payloads before buffering
+            try:
+                content_length = int(self.headers.get('Content-Length', 0))
+            except ValueError:
+                self.send_error(400, "Invalid Content-Length header")
+                return
+
+            # A negative length would make rfile.read() block until the
+            # client closes the connection, buffering unbounded bytes
+            if content_length < 0:
+                self.send_error(400, "Invalid Content-Length header")
+                return
+
+            if content_length > self.MAX_BODY:
+                self.send_error(413, "Request body too large")
+                return
+
             body = self.rfile.read(content_length)
-            request_data = json.loads(body.decode('utf-8'))
+            request_data = orjson.loads(body)
             
             # Extract API key from Authorization header
             auth_header = self.headers.get('Authorization', '')
@@ -148,23 +308,37 @@ class ProxyHandler(BaseHTTPRequestHandler):
             
             # Get the best available model
             best_model = self.model_stats.get_best_model(self.models_list)
-            
+
             if not best_model:
                 self.send_error(503, "No models available")
                 return
+
+            # Models already attempted for this request; retries exclude them
+            # so failover never re-picks a model that just failed
+            tried = {best_model['id']}
             
-            # Override model in request with our selected model
+            # Override model in request with our selected model. If the client
+            # already asked for it, forward the raw bytes untouched and skip
+            # the re-serialization entirely
             original_model = request_data.get('model', 'unknown')
-            request_data['model'] = best_model['id']
-            
+            if original_model == best_model['id']:
+                payload = body
+            else:
+                request_data['model'] = best_model['id']
+                payload = orjson.dumps(request_data)
+
             self.log_message(f"Routing request (original model: {original_model}) to: {best_model['id']}")
             
             # Try to make request to OpenRouter
             max_retries = min(3, len(self.models_list))
-            
+
+            # Once the status line has been sent, retrying or send_error
+            # would write a second response into the first one
+            response_started = False
+
             for attempt in range(max_retries):
                 try:
-                    response = requests.post(
+                    response = SESSION.post(
                         'https://openrouter.ai/api/v1/chat/completions',
                         headers={
                             'Authorization': f'Bearer {client_api_key}',
@@ -172,8 +346,9 @@ class ProxyHandler(BaseHTTPRequestHandler):
                             'HTTP-Referer': 'https://github.com/tcsenpai/openrouter-free-scanner',
                             'X-Title': 'OpenRouter Free Proxy'
                         },
-                        json=request_data,
-                        timeout=60
+                        data=payload,
+                        timeout=60,
+                        stream=True
                     )
                     
                     # Check for rate limit errors
@@ -183,16 +358,21 @@ class ProxyHandler(BaseHTTPRequestHandler):
                         
                         # Try next model
                         if attempt < max_retries - 1:
-                            best_model = self.model_stats.get_best_model(self.models_list)
+                            best_model = self.model_stats.get_best_model(self.models_list, exclude=tried)
                             if best_model:
-                                request_data['model'] = best_model['id']
+                                tried.add(best_model['id'])
+                                if request_data.get('model') != best_model['id']:
+                                    request_data['model'] = best_model['id']
+                                    payload = orjson.dumps(request_data)
                                 self.log_message(f"Retrying with next model: {best_model['id']}")
                                 continue
                         
                         # No more models to try
+                        response_started = True
                         self.send_response(response.status_code)
                         self.send_header('Content-Type', 'application/json')
                         self.send_header('Content-Length', str(len(response.content)))
+                        self.send_keep_alive_headers()
                         self.end_headers()
                         self.wfile.write(response.content)
                         return
@@ -201,48 +381,201 @@ class ProxyHandler(BaseHTTPRequestHandler):
                     if response.status_code == 200:
                         self.model_stats.record_success(best_model['id'])
                         self.log_message(f"Success with model: {best_model['id']}")
-                    else:   
+                    else:
                         self.log_message(f"Failed with model: {best_model['id']} response code: {response.status_code} response text: {response.text}")
-                    
-                    # Forward response to client
+
+                    content_type = response.headers.get('Content-Type', '')
+                    streaming = bool(request_data.get('stream')) or content_type.startswith('text/event-stream')
+
+                    if not streaming:
+                        # Buffer the body before starting the client response
+                        # so an upstream failure here is still retryable
+                        content = response.content
+
+                    # Forward response to client, dropping hop-by-hop headers
+                    response_started = True
                     self.send_response(response.status_code)
                     for header, value in response.headers.items():
-                        # Skip headers that shouldn't be forwarded
-                        # content-encoding is excluded because requests library already decompresses response.content
-                        if header.lower() not in ['transfer-encoding', 'connection', 'content-encoding', 'content-length']:
+                        if header.lower() not in self._HOP_BY_HOP:
                             self.send_header(header, value)
-                    # Set correct content-length for the actual (decompressed) content
-                    self.send_header('Content-Length', str(len(response.content)))
-                    self.end_headers()
-                    self.wfile.write(response.content)
+
+                    if streaming:
+                        # Pipe chunks through as they arrive so the client sees
+                        # the first token without waiting for the full response
+                        self.send_header('Transfer-Encoding', 'chunked')
+                        self.send_keep_alive_headers()
+                        self.end_headers()
+                        try:
+                            for chunk in response.iter_content(chunk_size=8192):
+                                if chunk:
+                                    self.wfile.write(f"{len(chunk):X}\r\n".encode('ascii'))
+                                    self.wfile.write(chunk)
+                                    self.wfile.write(b"\r\n")
+                                    self.wfile.flush()
+                            self.wfile.write(b"0\r\n\r\n")
+                        except BrokenPipeError:
+                            # Client went away mid-stream; stop reading upstream
+                            self.log_message(f"Client disconnected while streaming from {best_model['id']}")
+                            self.close_connection = True
+                            response.close()
+                    else:
+                        # Set correct content-length for the actual (decompressed) content
+                        self.send_header('Content-Length', str(len(content)))
+                        self.send_keep_alive_headers()
+                        self.end_headers()
+                        self.wfile.write(content)
                     return
                 
                 except requests.exceptions.RequestException as e:
                     self.log_message(f"Request error for {best_model['id']}: {str(e)}")
                     self.model_stats.record_error(best_model['id'])
-                    
+
+                    if response_started:
+                        # Headers (and part of the body) are already on the
+                        # wire; a retry or send_error would corrupt them. Drop
+                        # the connection so the client sees a truncated body
+                        # (for chunked, the missing terminator) and can recover
+                        self.log_message(f"Upstream failed mid-response from {best_model['id']}; closing connection")
+                        self.close_connection = True
+                        return
+
                     if attempt < max_retries - 1:
-                        best_model = self.model_stats.get_best_model(self.models_list)
+                        best_model = self.model_stats.get_best_model(self.models_list, exclude=tried)
                         if best_model:
-                            request_data['model'] = best_model['id']
+                            tried.add(best_model['id'])
+                            if request_data.get('model') != best_model['id']:
+                                request_data['model'] = best_model['id']
+                                payload = orjson.dumps(request_data)
                             continue
                     
                     self.send_error(502, f"Bad Gateway: {str(e)}")
                     return
         
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             self.send_error(400, "Invalid JSON in request body")
         except Exception as e:
             self.log_message(f"Unexpected error: {str(e)}")
             self.send_error(500, f"Internal error: {str(e)}")
 
 
-def start_proxy_server(port, limit=None, name=None, min_context_length=None, 
+class PooledHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer variant backed by a fixed pool of worker threads.
+
+    Reuses workers instead of spawning a thread per request, and caps
+    concurrency so a burst of clients can't create unbounded threads while
+    each one sits blocked on upstream I/O.
+    """
+
+    def __init__(self, server_address, RequestHandlerClass, max_workers=32):
+        super().__init__(server_address, RequestHandlerClass)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='proxy-worker')
+        # Open client sockets, so server_close can unblock workers that are
+        # waiting on an idle keep-alive connection
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address):
+        with self._connections_lock:
+            self._connections.add(request)
+        self._executor.submit(self._handle_request, request, client_address)
+
+    def _handle_request(self, request, client_address):
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self._connections_lock:
+                self._connections.discard(request)
+
+    def server_close(self):
+        super().server_close()
+        # Force-close outstanding client sockets; executor threads are
+        # non-daemon and would otherwise keep the process alive while they
+        # sit in a read on an idle connection
+        with self._connections_lock:
+            connections = list(self._connections)
+        for conn in connections:
+            try:
+                conn.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self._executor.shutdown(wait=False)
+
+
+def build_models_response(models):
+    """Serialize the OpenAI-compatible /v1/models payload for a models list."""
+    created = int(time.time())
+    return orjson.dumps({
+        'object': 'list',
+        'data': [
+            {
+                'id': model['id'],
+                'object': 'model',
+                'created': created,
+                'owned_by': 'openrouter',
+                'permission': [],
+                'root': model['id'],
+                'parent': None,
+            }
+            for model in models
+        ]
+    }, option=orjson.OPT_INDENT_2)
+
+
+def probe_models(models, api_key, model_stats, max_workers=16):
+    """
+    Verify that each model actually answers by sending a minimal completion,
+    probing concurrently, and seed model_stats with the results so
+    get_best_model starts from real priors instead of assuming every model
+    works.
+
+    Args:
+        models (list): Models to probe
+        api_key (str): OpenRouter API key used for the probe requests
+        model_stats (ModelStats): Stats to seed with probe outcomes
+        max_workers (int): Number of concurrent probes
+    """
+    def _probe(model):
+        try:
+            response = SESSION.post(
+                'https://openrouter.ai/api/v1/chat/completions',
+                headers={
+                    'Authorization': f'Bearer {api_key}',
+                    'Content-Type': 'application/json',
+                    'HTTP-Referer': 'https://github.com/tcsenpai/openrouter-free-scanner',
+                    'X-Title': 'OpenRouter Free Proxy'
+                },
+                json={
+                    'model': model['id'],
+                    'messages': [{'role': 'user', 'content': 'ping'}],
+                    'max_tokens': 1
+                },
+                timeout=30
+            )
+            return response.status_code == 200
+        except requests.exceptions.RequestException:
+            return False
+
+    print(f"Probing {len(models)} models ({max_workers} at a time)...")
+    healthy = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for model, ok in zip(models, executor.map(_probe, models)):
+            if ok:
+                model_stats.record_success(model['id'])
+                healthy += 1
+            else:
+                model_stats.record_error(model['id'])
+    print(f"Probe finished: {healthy}/{len(models)} models responded")
+
+
+def start_proxy_server(port, limit=None, name=None, min_context_length=None,
                        provider=None, sort_by='context_length', reverse=True,
-                       error_threshold=3, required_parameters=None):
+                       error_threshold=3, required_parameters=None,
+                       cache_ttl=DEFAULT_CACHE_TTL, refresh_interval=600,
+                       max_concurrency=32, probe=False):
     """
     Start the OpenAI-compatible proxy server.
-    
+
     Args:
         port (int): Port to run the server on
         limit (int): Limit number of models
@@ -253,27 +586,46 @@ def start_proxy_server(port, limit=None, name=None, min_context_length=None,
         reverse (bool): Reverse sort order
         error_threshold (int): Number of errors before switching models
         required_parameters (list): List of parameter names that must be supported by the model
+        cache_ttl (int): Seconds to reuse the cached model list, 0 to always fetch
+        refresh_interval (int): Seconds between background refreshes of the
+            models list, 0 to never refresh
+        max_concurrency (int): Number of worker threads serving requests;
+            the upstream connection pool is sized to match
+        probe (bool): Probe each model at startup (needs OPENROUTER_API_KEY)
+            and seed the failover stats with the results
     """
+    # Size the upstream pool to the worker pool so every concurrent request
+    # can hold a pooled TLS connection; pool_block waits for a free slot
+    # instead of opening throwaway unpooled connections under load
+    SESSION.mount('https://', HTTPAdapter(pool_connections=max_concurrency,
+                                          pool_maxsize=max_concurrency * 2,
+                                          pool_block=True, max_retries=0))
+
+    def apply_pipeline(models):
+        """Apply the configured filter/sort/limit pipeline to a models list."""
+        models = filter_models(
+            models,
+            name=name,
+            min_context_length=min_context_length,
+            provider=provider,
+            required_parameters=required_parameters
+        )
+        models = sort_models(models, sort_by=sort_by, reverse=reverse)
+
+        if limit:
+            models = models[:limit]
+
+        return models
+
     print("Fetching free models from OpenRouter...")
-    models = get_free_models()
-    
+    models = fetch_models_coalesced(cache_ttl=cache_ttl)
+
     if not models:
         print("Error: Could not fetch models from OpenRouter")
         return
-    
-    # Apply filters
-    models = filter_models(
-        models, 
-        name=name, 
-        min_context_length=min_context_length, 
-        provider=provider,
-        required_parameters=required_parameters
-    )
-    models = sort_models(models, sort_by=sort_by, reverse=reverse)
-    
-    if limit:
-        models = models[:limit]
-    
+
+    models = apply_pipeline(models)
+
     if not models:
         print("Error: No models match the specified criteria")
         return
@@ -286,10 +638,42 @@ def start_proxy_server(port, limit=None, name=None, min_context_length=None,
     
     # Initialize shared state
     ProxyHandler.models_list = models
+    ProxyHandler.models_response_body = build_models_response(models)
     ProxyHandler.model_stats = ModelStats(error_threshold=error_threshold)
+
+    if probe:
+        probe_api_key = os.environ.get('OPENROUTER_API_KEY')
+        if probe_api_key:
+            probe_models(models, probe_api_key, ProxyHandler.model_stats,
+                         max_workers=min(16, max_concurrency))
+        else:
+            print("Warning: --probe requires OPENROUTER_API_KEY to be set; skipping probes")
+
+    # Periodically re-fetch the models list off the request path so the
+    # proxy picks up added/removed free models without a restart
+    stop_refresh = threading.Event()
+
+    def refresh_models():
+        delay = refresh_interval
+        while not stop_refresh.wait(delay):
+            fresh = fetch_models_coalesced(cache_ttl=0)
+            if fresh:
+                fresh = apply_pipeline(fresh)
+            if fresh:
+                ProxyHandler.models_list = fresh
+                ProxyHandler.models_response_body = build_models_response(fresh)
+                print(f"Refreshed models list: {len(fresh)} models")
+                delay = refresh_interval
+            else:
+                # Back off on failure so a flaky upstream isn't hammered
+                delay = min(delay * 2, refresh_interval * 8)
+
+    if refresh_interval:
+        threading.Thread(target=refresh_models, daemon=True).start()
     
-    # Start server
-    server = HTTPServer(('0.0.0.0', port), ProxyHandler)
+    # Start server; pooled worker threads let concurrent clients overlap
+    # their upstream I/O waits instead of serializing behind a single socket
+    server = PooledHTTPServer(('0.0.0.0', port), ProxyHandler, max_workers=max_concurrency)
     
     print(f"\n{'='*60}")
     print(f"OpenRouter Free Proxy Server running on http://0.0.0.0:{port}")
@@ -310,7 +694,10 @@ def start_proxy_server(port, limit=None, name=None, min_context_length=None,
         server.serve_forever()
     except KeyboardInterrupt:
         print("\n\nShutting down server...")
+        stop_refresh.set()
         server.shutdown()
+        server.server_close()
+        SESSION.close()
         print("Server stopped.")
 
 
@@ -330,9 +717,17 @@ def main():
                        help="Reverse sort order (default: True)")
     parser.add_argument("--error-threshold", type=int, default=3,
                        help="Number of errors before switching models (default: 3)")
-    parser.add_argument("--require-params", type=str, 
+    parser.add_argument("--require-params", type=str,
                        help="Comma-separated list of required parameters (e.g., 'tool_choice,tools')")
-    
+    parser.add_argument("--cache-ttl", type=int, default=DEFAULT_CACHE_TTL,
+                       help=f"Seconds to reuse the cached model list, 0 to always fetch (default: {DEFAULT_CACHE_TTL})")
+    parser.add_argument("--refresh-interval", type=int, default=600,
+                       help="Seconds between background refreshes of the models list, 0 to disable (default: 600)")
+    parser.add_argument("--max-concurrency", type=int, default=32,
+                       help="Number of worker threads and upstream pool size (default: 32)")
+    parser.add_argument("--probe", action="store_true",
+                       help="Probe each model at startup using OPENROUTER_API_KEY and seed failover stats")
+
     args = parser.parse_args()
     
     # Parse required parameters
@@ -350,7 +745,11 @@ def main():
         sort_by=args.sort_by,
         reverse=args.reverse,
         error_threshold=args.error_threshold,
-        required_parameters=required_params
+        required_parameters=required_params,
+        cache_ttl=args.cache_ttl,
+        refresh_interval=args.refresh_interval,
+        max_concurrency=args.max_concurrency,
+        probe=args.probe
     )
 
 
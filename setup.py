@@ -7,6 +7,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests",
+        "orjson",
     ],
     entry_points={
         "console_scripts": [